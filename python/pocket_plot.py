@@ -8,7 +8,7 @@
 #  History:
 #  2022-02-11  1.0  new
 #
-import sys, re
+import sys, re, mmap, array
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -17,6 +17,16 @@ import sdr_rtk
 mpl.rcParams['toolbar'] = 'None';
 mpl.rcParams['font.size'] = 9
 
+# constants --------------------------------------------------------------------
+LOG_TIME = b'$TIME'  # log record tag of time
+LOG_FIELD = {        # log record tag and field index for log types
+    'LOCK' : (b'$CH', 4), 'C/N0': (b'$CH', 5), 'COFF': (b'$CH', 6),
+    'DOP'  : (b'$CH', 7), 'ADR' : (b'$CH', 8), 'L6FRM': (b'$L6FRM', 0)}
+LOG_REGEX = {        # regex to match log records of time and tag
+    rec: re.compile(rb'^(?:' + re.escape(LOG_TIME) + rb'|' + re.escape(rec) +
+    rb'),[^\r\n]*', re.M) for rec in (b'$CH', b'$L6FRM')}
+TIME_SEP = re.compile('[/:-_ ]') # separators of time string
+
 # show usage -------------------------------------------------------------------
 def show_usage():
     print('Usage: pocket_plot.py [-sig sig] [-prn prn] [-type type] [-atype type]')
@@ -25,65 +35,99 @@ def show_usage():
 
 # time string to time ----------------------------------------------------------
 def str2time(str):
-    return sdr_rtk.epoch2time([float(s) for s in re.split('[/:-_ ]', str)])
+    return sdr_rtk.epoch2time([float(s) for s in TIME_SEP.split(str)])
 
 # satellite elevations ---------------------------------------------------------
 def sat_els(ts, te, sat, pos, nav):
     rr = sdr_rtk.pos2ecef(pos)
-    els = []
     span = sdr_rtk.timediff(te, ts)
-    for t in np.arange(0.0, span + 30.0, 30.0):
-        time = sdr_rtk.timeadd(ts, t)
-        rs, dts, var, svh = sdr_rtk.satpos(time, time, sat, nav)
-        r, e = sdr_rtk.geodist(rs, rr)
-        az, el = sdr_rtk.satazel(pos, e)
-        els.append([time.time, el * sdr_rtk.R2D])
-    return np.array(els)
+    t = np.arange(0.0, span + 30.0, 30.0)
+    rs = np.zeros((len(t), 3))
+    for i in range(len(t)):
+        time = sdr_rtk.timeadd(ts, t[i])
+        rs[i] = sdr_rtk.satpos(time, time, sat, nav)[0][:3]
+    
+    # line-of-sight vectors and elevation angles
+    e = rs - rr
+    r = np.sqrt(np.sum(e ** 2, axis=1))
+    ok = np.sqrt(np.sum(rs ** 2, axis=1)) >= sdr_rtk.RE_WGS84
+    e[ok] /= r[ok, np.newaxis]
+    e[~ok] = 0.0
+    up = [np.cos(pos[0]) * np.cos(pos[1]), np.cos(pos[0]) * np.sin(pos[1]),
+        np.sin(pos[0])]
+    el = np.arcsin(np.clip(e @ up, -1.0, 1.0))
+    return np.column_stack([ts.time + np.floor(ts.sec + t), el * sdr_rtk.R2D])
+
+# UTC epochs to GPST (s) ------------------------------------------------------
+def epoch2gpst(ep):
+    if len(ep) == 0:
+        return np.zeros(0)
+    day = ((ep[:,0] - 1970).astype('int64').astype('datetime64[Y]').astype(
+        'datetime64[M]') + (ep[:,1] - 1).astype('int64')).astype(
+        'datetime64[D]') + (ep[:,2] - 1).astype('int64')
+    time = (day.astype('int64') * 86400.0 + ep[:,3] * 3600.0 + ep[:,4] * 60.0 +
+        ep[:,5])
+    leaps = []
+    for e in (ep[0], ep[-1]): # GPST - UTC at the first and last epochs
+        utc = sdr_rtk.epoch2time(e)
+        leaps.append(sdr_rtk.timediff(sdr_rtk.utc2gpst(utc), utc))
+    if leaps[0] == leaps[1]:
+        return time + leaps[0]
+    for i in range(len(ep)): # leap second inserted
+        utc = sdr_rtk.epoch2time(ep[i])
+        time[i] += sdr_rtk.timediff(sdr_rtk.utc2gpst(utc), utc)
+    return time
 
 # read tracking log -----------------------------------------------------------
 def read_log(ts, te, sig, prn, type, file):
-    time = sdr_rtk.GTIME()
-    log = []
-    fp = open(file)
-    for line in fp.readlines():
-        s = line.split(',')
-        if len(s) < 1:
-            continue
-        elif s[0] == '$TIME':
-            utc = sdr_rtk.epoch2time([float(s) for s in s[1:]])
-            time = sdr_rtk.utc2gpst(utc)
-            continue
-        
-        if ((ts.time != 0 and sdr_rtk.timediff(time, ts) <  0.0) or
-            (te.time != 0 and sdr_rtk.timediff(time, te) >= 0.0)):
-            continue
-        
-        if s[0] == '$CH':
-            if s[2] != sig or int(s[3]) != prn:
-                continue
-            elif type == 'LOCK':
-                log.append([time.time, float(s[4])])
-            elif type == 'C/N0':
-                log.append([time.time, float(s[5])])
-            elif type == 'COFF':
-                log.append([time.time, float(s[6])])
-            elif type == 'DOP':
-                log.append([time.time, float(s[7])])
-            elif type == 'ADR':
-                log.append([time.time, float(s[8])])
-        elif s[0] == '$L6FRM' and type == 'L6FRM':
-            if s[2] == sig and int(s[3]) == prn:
-                log.append([time.time, 1])
+    if type not in LOG_FIELD:
+        return np.array([])
+    rec, col = LOG_FIELD[type]
+    epochs, ix, vals = [], array.array('l'), []
+    fp = open(file, 'rb')
+    try:
+        buff = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(buff, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            buff.madvise(mmap.MADV_SEQUENTIAL)
+    except (ValueError, OSError): # empty file or not mappable
+        buff = fp.read()
+    sig, sprn = sig.encode(), b'%d' % (prn)
+    for m in LOG_REGEX[rec].finditer(buff):
+        s = m.group().split(b',')
+        if s[0] == LOG_TIME:
+            epochs += s[1:7]
+        elif s[2] == sig and s[3] == sprn:
+            ix.append(len(epochs) // 6)
+            vals.append(s[col] if col > 0 else b'1')
+    if isinstance(buff, mmap.mmap):
+        buff.close()
     fp.close()
-    return np.array(log)
+    
+    # time of each record by the last $TIME and select records in time span
+    ep = np.array(epochs, dtype='S').astype('float64').reshape(-1, 6)
+    ix = np.frombuffer(ix, dtype=ix.typecode)
+    time = np.hstack([0.0, epoch2gpst(ep)])[ix]
+    mask = np.full(len(time), True)
+    if ts.time != 0:
+        mask &= time >= ts.time + ts.sec
+    if te.time != 0:
+        mask &= time < te.time + te.sec
+    log = np.empty((np.count_nonzero(mask), 2))
+    log[:,0] = np.floor(time[mask])
+    log[:,1] = np.array(vals, dtype='S').astype('float64')[mask] # bulk cast
+    return log
 
 # plot log --------------------------------------------------------------------
 def plot_log(fig, rect, type, log, els, msg):
     color = ('darkblue', 'dimgray', 'blue')
     ax = fig.add_axes(rect)
+    if len(log) == 0:
+        ax.text(0.5, 0.5, 'NO DATA', ha='center', va='center',
+            transform=ax.transAxes)
+        return
     t0 = np.floor(log.T[0][0] / 86400) * 86400
     time = (log.T[0] - t0) / 3600
-    ax.plot(time, log.T[1], '.', color=color[0], ms=0.1)
+    ax.plot(time, log.T[1], '.', color=color[0], ms=0.1, rasterized=True)
     ax.grid(True, lw=0.4)
     ax.set_xticks(np.arange(0, 24 * 7, 2))
     ax.set_xlim(time[0], time[-1])
@@ -105,7 +149,7 @@ def plot_log(fig, rect, type, log, els, msg):
     if len(els) > 0:
         ax3 = ax.twinx()
         time = (els.T[0] - t0) / 3600
-        ax3.plot(time, els.T[1], '.', color=color[1], ms=0.1)
+        ax3.plot(time, els.T[1], '.', color=color[1], ms=0.1, rasterized=True)
         ax3.set_ylim(0, 90.0)
         ax3.set_ylabel('Elevation Angle (deg)', color=color[1])
         plt.setp(ax3.get_yticklabels(), color=color[1])
@@ -16,13 +16,24 @@ import sys
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-import sdr_func
+
+# global variable --------------------------------------------------------------
+psd_win = (0, 0.0, 0) # PSD window and frequencies cache
+blit_bg = None        # figure background for blitting
 
 # show usage --------------------------------------------------------------------
 def show_usage():
     print('Usage: pocket_psd.py [-t tint] [-f freq] [-IQ] [-h] [-n NFFT] file')
     exit()
 
+# read IF data -----------------------------------------------------------------
+def read_data(raw, fs, IQ, T, toff):
+    off = int(fs * toff * IQ)
+    cnt = int(fs * T * IQ)
+    if off + cnt > len(raw):
+        return raw[:0]
+    return raw[off:off+cnt] # int8 (interleaved I/Q for IQ-sampling)
+
 # plot PSD ---------------------------------------------------------------------
 def plot_psd(fig, rect, IQ, fs, fc, bc):
     yl = [-80, -45]
@@ -39,19 +50,42 @@ def plot_psd(fig, rect, IQ, fs, fc, bc):
     ax.set_xlim(xl)
     ax.set_ylim(yl)
     ax.grid(True, lw=0.4)
-    p = ax.text(0.97, 0.97, '', ha='right', va='top', color=fc, transform=ax.transAxes)
-    return ax, p
+    ax.set_xlabel('Frequency (MHz)')
+    ax.set_ylabel('Power Spectral Density (dB/Hz)')
+    anim = fig.canvas.supports_blit
+    p0 = ax.plot([], [], '-', color=fc, lw=0.3, animated=anim)
+    p1 = ax.text(0.97, 0.97, '', ha='right', va='top', color=fc,
+        transform=ax.transAxes, animated=anim)
+    return ax, (p0, p1)
+
+# PSD by Welch's method (Hanning window, no overlap) ---------------------------
+def psd_welch(data, IQ, fs, N):
+    global psd_win
+    if psd_win[:3] != (IQ, fs, N):
+        win = np.hanning(N).astype('float32')
+        if IQ == 1: # I
+            freq = np.fft.rfftfreq(N, 1.0 / fs)
+        else: # IQ
+            freq = np.fft.fftshift(np.fft.fftfreq(N, 1.0 / fs))
+        psd_win = (IQ, fs, N, win, freq, 1.0 / fs / np.sum(win ** 2))
+    win, freq, scale = psd_win[3:]
+    n = len(data) // N
+    if n <= 0:
+        data, n = np.hstack([data, np.zeros(N - len(data), dtype=data.dtype)]), 1
+    if IQ == 1: # I
+        X = np.fft.rfft(data.real[:n*N].reshape(n, N) * win)
+    else: # IQ
+        X = np.fft.fftshift(np.fft.fft(data[:n*N].reshape(n, N) * win), axes=1)
+    return freq, np.mean(X.real ** 2 + X.imag ** 2, axis=0) * scale
 
 # update PSD -------------------------------------------------------------------
 def update_psd(ax, p, data, IQ, fs, time, N, fc):
-    for line in ax.get_lines():
-        line.remove()
-    if IQ == 2: # IQ
+    if IQ == 2: # IQ (Q sign inverted in MAX2771)
         N = int(N / 2)
-    plt.sca(ax)
-    plt.psd(data, Fs=fs, NFFT=N, c=fc, lw=0.3)
-    p.set_text('Fs = %6.3f MHz\nT= %7.3f s' % (fs / 1e6, time))
-    ax.set_xlabel('Frequency (MHz)')
+        data = np.array(data[0::2] - data[1::2] * 1j, dtype='complex64')
+    freq, psd = psd_welch(data, IQ, fs, N)
+    p[0][0].set_data(freq, 10.0 * np.log10(psd))
+    p[1].set_text('Fs = %6.3f MHz\nT= %7.3f s' % (fs / 1e6, time))
 
 # plot histgram ----------------------------------------------------------------
 def plot_hist_d(fig, rect, text, fc, bc):
@@ -65,9 +99,12 @@ def plot_hist_d(fig, rect, text, fc, bc):
     ax.grid(True, lw=0.4)
     ax.text(0.07, 0.935, text, ha='center', va='top', color=fc,
         transform=ax.transAxes)
-    p = ax.text(0.95, 0.935, '', ha='right', va='top', color=fc,
-        transform=ax.transAxes)
-    return ax, p
+    anim = fig.canvas.supports_blit
+    p0 = ax.bar(np.arange(-5, 6), np.zeros(11), width=0.7, color=fc,
+        animated=anim)
+    p1 = ax.text(0.95, 0.935, '', ha='right', va='top', color=fc,
+        transform=ax.transAxes, animated=anim)
+    return ax, (p0, p1)
 
 # plot histgrams ---------------------------------------------------------------
 def plot_hist(fig, rect, fc, bc):
@@ -79,24 +116,69 @@ def plot_hist(fig, rect, fc, bc):
     ax2.set_xlabel('Quantized Value')
     return (ax1, ax2), (p1, p2)
 
+# counts of quantized values (-128 to 128) -------------------------------------
+def count_vals(data):
+    cnt = np.zeros(257, dtype='int64')
+    cnt[:256] = np.roll(np.bincount(data.view('uint8'), minlength=256), 128)
+    return cnt
+
+# counts of quantized values of I and Q (-128 to 128) --------------------------
+def count_vals_IQ(data):
+    n = len(data) // 2
+    cnt = np.bincount(data[:n*2].view('uint16'), minlength=65536) # I/Q pairs
+    cnt = cnt.reshape(256, 256) # cnt[Q][I]
+    if sys.byteorder == 'big':
+        cnt = cnt.T
+    cntI = np.zeros(257, dtype='int64')
+    cntQ = np.zeros(257, dtype='int64')
+    cntI[:256] = np.roll(np.sum(cnt, axis=0), 128)
+    cntQ[:256] = np.roll(np.sum(cnt, axis=1), 128)
+    return cntI, cntQ
+
 # update histgram --------------------------------------------------------------
-def update_hist_d(ax, p, data, fc):
-    for q in ax.patches:
-        q.remove()
-    if len(data) > 0:
-        bins = np.arange(-5.5, 6.5, 1)
-        plt.sca(ax)
-        plt.hist(data, bins=bins, density=True, rwidth=0.7, color=fc)
-        p.set_text('OFFSET = %.3f\nSIGMA = %.3f' % (np.mean(data), np.std(data)))
+def update_hist_d(ax, p, cnt, fc):
+    hist = cnt[123:134] / max(np.sum(cnt[123:134]), 1)
+    for bar, h in zip(p[0], hist):
+        bar.set_height(h)
+    n = np.sum(cnt)
+    if n > 0:
+        val = np.arange(-128, 129)
+        ave = np.dot(val, cnt) / n
+        std = np.sqrt(max(np.dot(val ** 2, cnt) / n - ave ** 2, 0.0))
+        p[1].set_text('OFFSET = %.3f\nSIGMA = %.3f' % (ave, std))
 
 # update histgrams -------------------------------------------------------------
 def update_hist(ax, p, data, IQ, fc):
     if IQ == 1: # I
-        update_hist_d(ax[0], p[0], data.real, fc)
-        update_hist_d(ax[1], p[1], [], fc)
-    else: # IQ
-        update_hist_d(ax[0], p[0], data.real, fc)
-        update_hist_d(ax[1], p[1], data.imag, fc)
+        update_hist_d(ax[0], p[0], count_vals(data), fc)
+        update_hist_d(ax[1], p[1], np.zeros(257, dtype='int64'), fc)
+    else: # IQ (Q sign inverted in MAX2771)
+        cntI, cntQ = count_vals_IQ(data)
+        update_hist_d(ax[0], p[0], cntI, fc)
+        update_hist_d(ax[1], p[1], cntQ[::-1], fc)
+
+# draw animated artists -------------------------------------------------------
+def draw_anim(fig):
+    for ax in fig.axes:
+        for a in ax.get_children():
+            if a.get_animated():
+                ax.draw_artist(a)
+
+# save figure background for blitting -----------------------------------------
+def on_draw(event):
+    global blit_bg
+    blit_bg = event.canvas.copy_from_bbox(event.canvas.figure.bbox)
+    draw_anim(event.canvas.figure)
+
+# update figure by blitting ----------------------------------------------------
+def update_fig(fig):
+    if blit_bg is None:
+        fig.canvas.draw_idle()
+    else:
+        fig.canvas.restore_region(blit_bg)
+        draw_anim(fig)
+        fig.canvas.blit(fig.bbox)
+    fig.canvas.flush_events()
 
 #-------------------------------------------------------------------------------
 #
@@ -166,6 +248,12 @@ if __name__ == '__main__':
         print('Specify input file.')
         exit()
     
+    try:
+        raw = np.memmap(file, dtype='int8', mode='r')
+    except (OSError, ValueError):
+        print('file open error: %s' % (file))
+        exit()
+    
     mpl.rcParams['toolbar'] = 'None';
     mpl.rcParams['font.size'] = 9
     fig = plt.figure(window, figsize=size)
@@ -177,21 +265,27 @@ if __name__ == '__main__':
         ax2, p2 = plot_hist(fig, rect2, fc, bc)
     else:
         ax1, p1 = plot_psd(fig, rect0, IQ, fs, fc, bc)
+    if fig.canvas.supports_blit:
+        fig.canvas.mpl_connect('draw_event', on_draw)
+    plt.show(block=False)
     
     try:
         for i in range(0, 10000000):
-            data = sdr_func.read_data(file, fs, IQ, tint, toff=tint * i)
+            data = read_data(raw, fs, IQ, tint, tint * i)
             
             if plt.figure(window) != fig: # window closed
                 exit()
             
-            if len(data) >= int(fs * tint):
+            if len(data) > 0:
                 if hist:
                     update_psd(ax1, p1, data, IQ, fs, tint * i, N, fc)
                     update_hist(ax2, p2, data, IQ, fc)
                 else:
                     update_psd(ax1, p1, data, IQ, fs, tint * i, N, fc)
-            plt.pause(1e-3) 
+                update_fig(fig)
+            else:
+                raw = np.memmap(file, dtype='int8', mode='r') # remap file
+                plt.pause(1e-3)
     
     except KeyboardInterrupt:
         exit()
@@ -34,6 +34,7 @@ Zp = np.zeros(1) * np.nan
 Xt = np.zeros(1)
 Yt = np.zeros(1) * np.nan
 Zt = np.zeros(1) * np.nan
+nav_cnt = -1         # number of nav data shown in plot
 
 # plot settings ----------------------------------------------------------------
 window = 'PocketSDR - GNSS SIGNAL TRACKING'
@@ -64,9 +65,12 @@ def read_data(fp, N, IQ, buff, ix):
     if len(raw) < N * IQ:
         return False
     elif IQ == 1: # I
-        buff[ix:ix+N] = np.array(raw, dtype='complex64')
+        buff[ix:ix+N] = raw
     else: # IQ (Q sign inverted in MAX2771)
-        buff[ix:ix+N] = np.array(raw[0::2] - raw[1::2] * 1j, dtype='complex64')
+        data = buff[ix:ix+N]
+        data.real = raw[0::2]
+        data.imag = raw[1::2]
+        data.imag *= -1.0
     return True
 
 # print receiver channel status header -----------------------------------------
@@ -84,18 +88,16 @@ def sync_stat(ch):
 
 # update receiver channel status -----------------------------------------------
 def update_stat(prns, ch, ncol):
-    if ncol > 0: # cursor up
-        print(ESC_UP % (ncol), end='')
-    ncol = 0
+    lines = [ESC_UP % (ncol)] if ncol > 0 else [] # cursor up
     for i in range(len(prns)):
-        print('%s%9.2f %5s %3d %5s %8.2f %4.1f %-13s%10.7f %7.1f %11.1f %s %4d %4d %4d %3d%s' %
+        lines.append('%s%9.2f %5s %3d %5s %8.2f %4.1f %-13s%10.7f %7.1f %11.1f %s %4d %4d %4d %3d%s\n' %
             (ESC_COL if ch[i].state == 'LOCK' else '',
             ch[i].time, ch[i].sig, prns[i], ch[i].state, ch[i].lock * ch[i].T,
             ch[i].cn0, cn0_bar(ch[i].cn0), ch[i].coff * 1e3, ch[i].fd, ch[i].adr,
             sync_stat(ch[i]), ch[i].nav.count[0], ch[i].nav.count[1], ch[i].lost,
             ch[i].nav.nerr, ESC_RES if ch[i].state == 'LOCK' else ''))
-        ncol += 1
-    return ncol
+    print(''.join(lines), end='', flush=True) # single write for all channels
+    return len(prns)
 
 # C/N0 bar ---------------------------------------------------------------------
 def cn0_bar(cn0):
@@ -116,7 +118,7 @@ def init_plot(sig, prn, ch, env, p3d, file):
         ax0.text(0.97, 0.85, text, color=fc, ha='right', va='top')
         p1 = (ax0.text(0.03, 0.95, '', ha='left', va='top'),
               ax0.text(0.03, 0.05, '', ha='left', va='bottom'),
-              ax0.text(0.97, 0.10, '', color=fc, ha='right', va='bottom'))
+              ax0.text(0.97, 0.10, '', color=fc, ha='right', va='bottom')) + p1
     else:
         Tc = ch.T / sdr_code.code_len(sig)
         ax1, p1 = plot_corr_env (fig, rect1, env, pos, pos / Tc)
@@ -171,9 +173,7 @@ def plot_corr_env(fig, rect, env, pos, chip):
 
 # update correlation envelope --------------------------------------------------
 def update_corr_env(ax, p, ch, env):
-    Tc = ch.T / sdr_code.code_len(sig)
-    x0 = ch.coff * 1e3
-    x = x0 + np.array(ch.trk.pos) / ch.fs * 1e3
+    x = ch.coff * 1e3 + ch.trk.pos * (1e3 / ch.fs)
     if env:
         y = np.abs(ch.trk.C.real)
     else:
@@ -200,14 +200,17 @@ def plot_corr_3d(fig, rect, env, pos):
     ax.zaxis.pane.set_visible(False)
     ax.grid(False)
     ax.view_init(35, -50)
-    return ax, ()
+    p0 = ax.plot([], [], [], '.', color=gc, ms=2)
+    p1 = ax.plot([], [], [], '.', color=fc, ms=4)
+    p2 = ax.plot([], [], [], '-', color=fc, lw=0.4)
+    p3 = ax.plot([], [], [], '-', color=fc, lw=0.8)
+    p4 = ax.plot([], [], [], '.', color=fc, ms=10)
+    return ax, (p0, p1, p2, p3, p4)
 
 # update correlation 3D --------------------------------------------------------
 def update_corr_3d(ax, p, ch, env, toff, tspan):
     global Xp, Yp, Zp, Xt, Yt, Zt
     
-    for line in ax.lines:
-        line.remove()
     N = int(tspan / ch.T)
     time = ch.time + np.arange(-N+1, 1) * ch.T
     t0 = toff if ch.lock < N else ch.time - N * ch.T
@@ -225,17 +228,17 @@ def update_corr_3d(ax, p, ch, env, toff, tspan):
     Xp = np.hstack([Xp[ix:], x[4:], np.nan])
     Yp = np.hstack([Yp[ix:], y[4:], np.nan])
     Zp = np.hstack([Zp[ix:], z[4:], np.nan])
-    ix = np.where(Xt >= xl[0])
-    Xt = np.hstack([Xt[ix], ch.time])
-    Yt = np.hstack([Yt[ix], y[0]])
-    Zt = np.hstack([Zt[ix], z[0]])
+    ix = np.searchsorted(Xt, xl[0]) # Xt in time order
+    Xt = np.hstack([Xt[ix:], ch.time])
+    Yt = np.hstack([Yt[ix:], y[0]])
+    Zt = np.hstack([Zt[ix:], z[0]])
     y1 = Yt[len(Yt)//2]
     yl = [y1 + ch.trk.pos[4] / ch.fs * 1.3e3, y1 + ch.trk.pos[-1] / ch.fs * 1.3e3]
-    ax.plot(Xt, Yt, np.zeros(len(Zt)), '.', color=gc, ms=2)
-    ax.plot(Xt, Yt, Zt, '.', color=fc, ms=4)
-    ax.plot(Xp, Yp, Zp, '-', color=fc, lw=0.4)
-    ax.plot(x[4:], y[4:], z[4:], '-', color=fc, lw=0.8)
-    ax.plot(x[:3], y[:3], z[:3], '.', color=fc, ms=10)
+    p[3][0].set_data_3d(Xt, Yt, np.zeros(len(Zt)))
+    p[4][0].set_data_3d(Xt, Yt, Zt)
+    p[5][0].set_data_3d(Xp, Yp, Zp)
+    p[6][0].set_data_3d(x[4:], y[4:], z[4:])
+    p[7][0].set_data_3d(x[:3], y[:3], z[:3])
     ax.set_xlim(xl)
     ax.set_ylim(yl)
     ax.set_xbound(xl)
@@ -326,7 +329,11 @@ def plot_nav_data(fig, rect):
 
 # update nav data --------------------------------------------------------------
 def update_nav_data(ax, p, ch):
+    global nav_cnt
     N = len(ch.nav.data)
+    if N == nav_cnt: # no new nav data
+        return
+    nav_cnt = N
     text = ''
     for i in range(0 if N <= 4 else N - 4, N):
         text += '%7.2f: ' % (ch.nav.data[i][0])
@@ -123,6 +123,7 @@ def trk_new(sig, prn, code, T, fs, sp_corr, add_corr):
     trk.pos = [0, -pos, pos, -80]   # correlator positions {P,E,L,N} (samples)
     if add_corr > 0:                # additional correlator positions
         trk.pos += range(-add_corr, add_corr + 1)
+    trk.pos = np.array(trk.pos, dtype='int32')
     trk.C = np.zeros(len(trk.pos), dtype='complex64') # correlator outputs
     trk.P = np.zeros(N_HIST, dtype='complex64') # history of P corr outputs
     trk.sec_sync = trk.sec_pol = 0  # secondary code sync and polarity
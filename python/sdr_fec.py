@@ -34,6 +34,7 @@ try:
 except:
     print('load libfec.so error (%s)' % (env))
     exit()
+libfec.create_viterbi27.restype = c_void_p
 
 #-------------------------------------------------------------------------------
 #  Encode convolution code (K=7, R=1/2, Poly=G1:0x4F,G2:0x6D).
@@ -79,7 +80,6 @@ def decode_conv(data):
         return NONE
     
     # initialize Viterbi decoder
-    libfec.create_viterbi27.restype = c_void_p
     dec = libfec.create_viterbi27(N)
     if dec == None:
         print('decode_conv: deocoder create error')
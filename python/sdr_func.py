@@ -37,6 +37,18 @@ except:
     libsdr = None
 else:
     libsdr.sdr_func_init(c_char_p((dir + '/fftw_wisdom.txt').encode()))
+    libsdr.sdr_corr_std.argtypes = [
+        ctypeslib.ndpointer('complex64'), c_int32, c_int32, c_double,
+        c_double, c_double, ctypeslib.ndpointer('complex64'),
+        ctypeslib.ndpointer('int32'), c_int32,
+        ctypeslib.ndpointer('complex64')]
+    libsdr.sdr_corr_fft.argtypes = [
+        ctypeslib.ndpointer('complex64'), c_int32, c_int32, c_double,
+        c_double, c_double, ctypeslib.ndpointer('complex64'),
+        ctypeslib.ndpointer('complex64')]
+    libsdr.sdr_mix_carr.argtypes = [
+        ctypeslib.ndpointer('complex64'), c_int32, c_int32, c_double,
+        c_double, c_double, ctypeslib.ndpointer('complex64')]
 
 # constants --------------------------------------------------------------------
 DOP_STEP = 0.5     # Doppler frequency search step (* 1 / code cycle)
@@ -134,12 +146,7 @@ def dop_bins(T, dop, max_dop):
 def corr_std(buff, ix, N, fs, fc, phi, code, pos):
     if libsdr and LIBSDR_ENA:
         corr = np.empty(len(pos), dtype='complex64')
-        pos = np.array(pos, dtype='int32')
-        libsdr.sdr_corr_std.argtypes = [
-            ctypeslib.ndpointer('complex64'), c_int32, c_int32, c_double,
-            c_double, c_double, ctypeslib.ndpointer('complex64'),
-            ctypeslib.ndpointer('int32'), c_int32,
-            ctypeslib.ndpointer('complex64')]
+        pos = np.asarray(pos, dtype='int32') # no copy if int32 ndarray
         libsdr.sdr_corr_std(buff, ix, N, fs, fc, phi, code, pos, len(pos), corr)
         return corr
     else:
@@ -150,10 +157,6 @@ def corr_std(buff, ix, N, fs, fc, phi, code, pos):
 def corr_fft(buff, ix, N, fs, fc, phi, code_fft):
     if libsdr and LIBSDR_ENA:
         corr = np.empty(N, dtype='complex64')
-        libsdr.sdr_corr_fft.argtypes = [
-            ctypeslib.ndpointer('complex64'), c_int32, c_int32, c_double,
-            c_double, c_double, ctypeslib.ndpointer('complex64'),
-            ctypeslib.ndpointer('complex64')]
         libsdr.sdr_corr_fft(buff, ix, N, fs, fc, phi, code_fft, corr)
         return corr
     else:
@@ -164,9 +167,6 @@ def corr_fft(buff, ix, N, fs, fc, phi, code_fft):
 def mix_carr(buff, ix, N, fs, fc, phi):
     if libsdr and LIBSDR_ENA:
         data = np.empty(N, dtype='complex64')
-        libsdr.sdr_mix_carr.argtypes = [
-            ctypeslib.ndpointer('complex64'), c_int32, c_int32, c_double,
-            c_double, c_double, ctypeslib.ndpointer('complex64')]
         libsdr.sdr_mix_carr(buff, ix, N, fs, fc, phi, data)
         return data
     else:
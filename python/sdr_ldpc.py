@@ -37,6 +37,7 @@ try:
 except:
     print('load libldpc.so error (%s)' % (env))
     exit()
+libldpc.mod2sparse_allocate.restype = c_void_p
 
 # constants --------------------------------------------------------------------
 ERR_PROB = 1e-5
@@ -1280,7 +1281,6 @@ def decode_LDPC_BCNV3(syms):
 # generate LDPC parity check matrix --------------------------------------------
 def gen_LDPC_H(m, n, H_A, H_B, H_C, H_D, H_E, H_T):
     
-    libldpc.mod2sparse_allocate.restype = c_void_p
     H = libldpc.mod2sparse_allocate(m, n)
     
     for i in range(len(H_A)):
@@ -138,6 +138,51 @@ class GEPH(Structure): # geph_t
 # global variable --------------------------------------------------------------
 GTIME0 = GTIME(time=0, sec=0.0)
 
+# set argument and return types of library functions ---------------------------
+librtk.obs2code.restype = c_uint8
+librtk.code2obs.restype = c_char_p
+librtk.epoch2time.restype = GTIME
+librtk.time2epoch.argtypes = [GTIME, c_void_p]
+librtk.gpst2time.restype = GTIME
+librtk.time2gpst.argtypes = [GTIME, POINTER(c_int32)]
+librtk.time2gpst.restype = c_double
+librtk.gpst2utc.argtypes = [GTIME]
+librtk.gpst2utc.restype = GTIME
+librtk.utc2gpst.argtypes = [GTIME]
+librtk.utc2gpst.restype = GTIME
+librtk.timeadd.argtypes = [GTIME, c_double]
+librtk.timeadd.restype = GTIME
+librtk.timediff.argtypes = [GTIME, GTIME]
+librtk.timediff.restype = c_double
+librtk.time2str.argtypes = [GTIME, c_char_p, c_int32]
+librtk.timeget.restype = GTIME
+librtk.satazel.restype = c_double
+librtk.geodist.restype = c_double
+librtk.ionmodel_nav.argtypes = [GTIME, c_void_p, c_void_p, c_void_p]
+librtk.ionmodel_nav.restype = c_double
+librtk.tropmodel.argtypes = [GTIME, c_void_p, c_void_p, c_double]
+librtk.tropmodel.restype = c_double
+librtk.navgettgd.restype = c_double
+librtk.getbitu.restype = c_uint32
+librtk.getbits.restype = c_int32
+librtk.rtk_crc16.restype = c_uint32
+librtk.rtk_crc24q.restype = c_uint32
+librtk.rtk_crc32.restype = c_uint32
+librtk.test_glostr.restype = c_int32
+librtk.strnew.restype = c_void_p
+librtk.obsnew.restype = c_void_p
+librtk.navnew.restype = c_void_p
+librtk.readrnxt.argtypes = [c_char_p, c_int32, GTIME, GTIME, c_double,
+    c_char_p, c_void_p, c_void_p, c_void_p]
+librtk.obsget.argtypes = [c_void_p, c_int32]
+librtk.obsget.restype = POINTER(OBSD)
+librtk.navgeteph.argtypes = [c_void_p, c_int32]
+librtk.navgeteph.restype = POINTER(EPH)
+librtk.navgetgeph.argtypes = [c_void_p, c_int32]
+librtk.navgetgeph.restype = POINTER(GEPH)
+librtk.satpos.argtypes = [GTIME, GTIME, c_int32, c_int32, c_void_p, c_void_p,
+    c_void_p, POINTER(c_double), POINTER(c_int32)]
+
 # satellite number -------------------------------------------------------------
 def satno(sys, prn):
     return librtk.satno(c_int32(sys), c_int32(prn))
@@ -160,12 +205,10 @@ def satno2id(sat):
 
 # obs type string to code ------------------------------------------------------
 def obs2code(obs):
-    librtk.obs2code.restype = c_uint8
     return librtk.obs2code(c_char_p(obs.encode()))
 
 # obs code to type string ------------------------------------------------------
 def code2obs(code):
-    librtk.code2obs.restype = c_char_p
     return librtk.code2obs(c_uint8(code)).decode()
 
 # epoch to time ----------------------------------------------------------------
@@ -173,64 +216,49 @@ def epoch2time(ep):
     epoch = np.zeros(6)
     epoch[:len(ep)] = ep
     p = epoch.ctypes.data_as(POINTER(c_double))
-    librtk.epoch2time.restype = GTIME
     return librtk.epoch2time(p)
 
 # time to epoch ----------------------------------------------------------------
 def time2epoch(time):
     ep = np.zeros(6, dtype='double')
     p = ep.ctypes.data_as(POINTER(c_double))
-    librtk.time2epoch.argtypes = [GTIME, c_void_p]
     librtk.time2epoch(time, p)
     return ep
 
 # GPS week and tow to time -----------------------------------------------------
 def gpst2time(week, sec):
-    librtk.gpst2time.restype = GTIME
     return librtk.gpst2time(c_int32(week), c_double(sec))
 
 # time to GPS week and tow -----------------------------------------------------
 def time2gpst(time):
     week = c_int32()
-    librtk.time2gpst.argtypes = [GTIME, POINTER(c_int32)]
-    librtk.time2gpst.restype = c_double
     sec = librtk.time2gpst(time, byref(week))
     return week.value, sec
 
 # GPS time to UTC --------------------------------------------------------------
 def gpst2utc(time):
-    librtk.gpst2utc.argtypes = [GTIME]
-    librtk.gpst2utc.restype = GTIME
     return librtk.gpst2utc(time)
 
 # UTC to GPS time --------------------------------------------------------------
 def utc2gpst(time):
-    librtk.utc2gpst.argtypes = [GTIME]
-    librtk.utc2gpst.restype = GTIME
     return librtk.utc2gpst(time)
 
 # add time ---------------------------------------------------------------------
 def timeadd(time, sec):
-    librtk.timeadd.argtypes = [GTIME, c_double]
-    librtk.timeadd.restype = GTIME
     return librtk.timeadd(time, sec)
 
 # time difference --------------------------------------------------------------
 def timediff(time1, time2):
-    librtk.timediff.argtypes = [GTIME, GTIME]
-    librtk.timediff.restype = c_double
     return librtk.timediff(time1, time2)
 
 # time to time string ----------------------------------------------------------
 def time2str(time, n):
     buff = create_string_buffer(32 + n)
-    librtk.time2str.argtypes = [GTIME, c_char_p, c_int32]
     librtk.time2str(time, buff, n)
     return buff.value.decode()
 
 # get current time in UTC ------------------------------------------------------
 def timeget():
-    librtk.timeget.restype = GTIME
     return librtk.timeget()
 
 # trace open -------------------------------------------------------------------
@@ -255,7 +283,6 @@ def satazel(pos, e):
     p1 = np.array(pos, dtype='double').ctypes.data_as(POINTER(c_double))
     p2 = np.array(e, dtype='double').ctypes.data_as(POINTER(c_double))
     p3 = azel.ctypes.data_as(POINTER(c_double))
-    librtk.satazel.restype = c_double
     el = librtk.satazel(p1, p2, p3)
     return azel
 
@@ -267,7 +294,6 @@ def geodist(rs, rr):
     p1 = np.array(rs, dtype='double').ctypes.data_as(POINTER(c_double))
     p2 = np.array(rr, dtype='double').ctypes.data_as(POINTER(c_double))
     p3 = e.ctypes.data_as(POINTER(c_double))
-    librtk.geodist.restype = c_double
     r = librtk.geodist(p1, p2, p3)
     return r, e
 
@@ -277,8 +303,6 @@ def ionmodel(time, nav, pos, azel):
         return 0.0
     p1 = np.array(pos, dtype='double').ctypes.data_as(POINTER(c_double))
     p2 = np.array(azel, dtype='double').ctypes.data_as(POINTER(c_double))
-    librtk.ionmodel_nav.argtypes = [GTIME, c_void_p, c_void_p, c_void_p]
-    librtk.ionmodel_nav.restype = c_double
     return librtk.ionmodel_nav(time, nav, p1, p2)
 
 # troposhere model -------------------------------------------------------------
@@ -287,20 +311,16 @@ def tropmodel(time, pos, azel, humi=0.7):
         return 0.0
     p1 = np.array(pos, dtype='double').ctypes.data_as(POINTER(c_double))
     p2 = np.array(azel, dtype='double').ctypes.data_as(POINTER(c_double))
-    librtk.tropmodel.argtypes = [GTIME, c_void_p, c_void_p, c_double]
-    librtk.tropmodel.restype = c_double
     return librtk.tropmodel(time, p1, p2, humi)
 
 # get TGD in m -----------------------------------------------------------------
 def get_tgd(sat, nav):
-    librtk.navgettgd.restype = c_double
     return librtk.navgettgd(c_int32(sat), c_void_p(nav))
 
 # extract unsigned bits --------------------------------------------------------
 def getbitu(data, pos, len):
     if data.dtype != 'uint8':
         return 0
-    librtk.getbitu.restype = c_uint32
     p = data.ctypes.data_as(POINTER(c_uint8))
     return librtk.getbitu(p, c_int(pos), c_int(len))
 
@@ -308,7 +328,6 @@ def getbitu(data, pos, len):
 def getbits(data, pos, len):
     if data.dtype != 'uint8':
         return 0
-    librtk.getbits.restype = c_int32
     p = data.ctypes.data_as(POINTER(c_uint8))
     return librtk.getbits(p, c_int(pos), c_int(len))
 
@@ -330,7 +349,6 @@ def setbits(data, pos, len, val):
 def crc16(data, len):
     if data.dtype != 'uint8':
         return 0
-    librtk.rtk_crc16.restype = c_uint32
     p = data.ctypes.data_as(POINTER(c_uint8))
     return librtk.rtk_crc16(p, c_int(len))
 
@@ -338,7 +356,6 @@ def crc16(data, len):
 def crc24q(data, len):
     if data.dtype != 'uint8':
         return 0
-    librtk.rtk_crc24q.restype = c_uint32
     p = data.ctypes.data_as(POINTER(c_uint8))
     return librtk.rtk_crc24q(p, c_int(len))
 
@@ -346,7 +363,6 @@ def crc24q(data, len):
 def crc32(data, len):
     if data.dtype != 'uint8':
         return 0
-    librtk.rtk_crc32.restype = c_uint32
     p = data.ctypes.data_as(POINTER(c_uint8))
     return librtk.rtk_crc32(p, c_int(len))
 
@@ -354,13 +370,11 @@ def crc32(data, len):
 def test_glostr(data):
     if data.dtype != 'uint8':
         return 0
-    librtk.test_glostr.restype = c_int32
     p = data.ctypes.data_as(POINTER(c_uint8))
     return librtk.test_glostr(p)
 
 # open stream ------------------------------------------------------------------
 def stropen(type, mode, path):
-    librtk.strnew.restype = c_void_p;
     stream = librtk.strnew()
     if not stream:
         return None
@@ -429,12 +443,8 @@ def strsum(stream):
 def readrnx(file, rcv=1, ts=GTIME(), te=GTIME(), tint=0.0, opt=''):
     if 'Windows' in env:
         file = file.replace('/', '\\')
-    librtk.obsnew.restype = c_void_p
-    librtk.navnew.restype = c_void_p
     obs = librtk.obsnew()
     nav = librtk.navnew()
-    librtk.readrnxt.argtypes = [c_char_p, c_int32, GTIME, GTIME, c_double,
-        c_char_p, c_void_p, c_void_p, c_void_p]
     
     if not librtk.readrnxt(file.encode(), rcv, ts, te, tint, opt.encode(), obs,
         nav, None):
@@ -451,8 +461,6 @@ def navfree(nav):
 
 # get OBS data (generator function) --------------------------------------------
 def obsget(obs):
-    librtk.obsget.argtypes = [c_void_p, c_int32]
-    librtk.obsget.restype = POINTER(OBSD)
     for i in range(10000000):
         data = librtk.obsget(obs, i)
         if data:
@@ -462,8 +470,6 @@ def obsget(obs):
 
 # get ephemeris (generator function) -------------------------------------------
 def ephget(nav):
-    librtk.navgeteph.argtypes = [c_void_p, c_int32]
-    librtk.navgeteph.restype = POINTER(EPH)
     for i in range(10000000):
         eph = librtk.navgeteph(nav, i)
         if eph:
@@ -473,8 +479,6 @@ def ephget(nav):
 
 # get GLONASS ephemeris (generator function) -----------------------------------
 def gephget(nav):
-    librtk.navgetgeph.argtypes = [c_void_p, c_int32]
-    librtk.navgetgeph.restype = POINTER(GEPH)
     for i in range(10000000):
         geph = librtk.navgetgeph(nav, i)
         if geph:
@@ -488,8 +492,6 @@ def satpos(time, teph, sat, nav, ephopt=EPHOPT_BRDC):
     dts = np.zeros(2, dtype='double')
     var = c_double()
     svh = c_int32()
-    librtk.satpos.argtypes = [GTIME, GTIME, c_int32, c_int32, c_void_p,
-        c_void_p, c_void_p, POINTER(c_double), POINTER(c_int32)]
     p1 = rs.ctypes.data_as(POINTER(c_double))
     p2 = dts.ctypes.data_as(POINTER(c_double))
     if not librtk.satpos(time, teph, sat, ephopt, nav, p1, p2, byref(var),